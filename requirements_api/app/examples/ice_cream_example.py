@@ -1,6 +1,6 @@
-import uuid
 import itertools
-from ..store import requirements_store
+from ..store import ReqRow, reset_store, add_requirements
+from ..utils import fast_dump, intern_enum_fields
 from ..schemas import (
     Requirement, RequirementLayer, RequirementType, PriorityLevel,
     RequirementStatus, RequirementSource, Link, LinkType
@@ -10,223 +10,262 @@ from ..schemas import (
 _counter = itertools.count(1)
 def _id(prefix: str) -> str:
     return f"{prefix}-{next(_counter):03d}"
-def create_ice_cream_example() -> None:
-    """Deep-dive Ice-Cream Shop demo with full traceability."""
-    requirements_store.clear()
+
+# Enum members bound once at module level so the literal blocks below avoid
+# an attribute lookup on the Enum class per field.
+_FUNCTIONAL = RequirementType.functional
+_NON_FUNCTIONAL = RequirementType.non_functional
+_CONSTRAINT = RequirementType.constraint
+_VERIFICATION = RequirementType.verification
+_STAKEHOLDER = RequirementSource.stakeholder
+_DOCUMENT = RequirementSource.document
+_PRODUCT_OWNER = RequirementSource.product_owner
+_REGULATION = RequirementSource.regulation
+_DEVELOPER = RequirementSource.developer
+_SUPPORT_TICKET = RequirementSource.support_ticket
+_HIGH = PriorityLevel.high
+_MEDIUM = PriorityLevel.medium
+_LOW = PriorityLevel.low
+_APPROVED = RequirementStatus.approved
+_PROPOSED = RequirementStatus.proposed
+_PLANNED = RequirementStatus.planned
+_DRAFT = RequirementStatus.draft
+_BUS_LAYER = RequirementLayer.business
+_SYS_LAYER = RequirementLayer.system
+_SW_LAYER = RequirementLayer.software
+_TEST_LAYER = RequirementLayer.test
+_SATISFIES = LinkType.satisfies
+_DEPENDS_ON = LinkType.depends_on
+_REFINES = LinkType.refines
+def _build_rows():
+    """Build the Ice-Cream Shop demo rows once; inputs are constants.
+
+    Models are built with ``model_construct()`` (no validation) since every field
+    below is a hard-coded literal that already conforms to the schema.
+    """
 
     # ────────────────────────────────────────────────────────────────
     # 1. BUSINESS REQUIREMENTS
     # ────────────────────────────────────────────────────────────────
-    bus_online_orders = Requirement(
+    bus_online_orders = Requirement.model_construct(
         display_id=_id("BUS"),
-        layer=RequirementLayer.business,
-        type=RequirementType.functional,
+        layer=_BUS_LAYER,
+        type=_FUNCTIONAL,
         title="Online Ordering Platform",
         description="Allow customers to order ice-cream online from any device.",
         rationale="Capture digital revenue and improve customer convenience.",
-        source=RequirementSource.stakeholder,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.approved,
+        source=_STAKEHOLDER,
+        priority=_HIGH,
+        status=_APPROVED,
     )
-    bus_loyalty = Requirement(
+    bus_loyalty = Requirement.model_construct(
         display_id=_id("BUS"),
-        layer=RequirementLayer.business,
-        type=RequirementType.functional,
+        layer=_BUS_LAYER,
+        type=_FUNCTIONAL,
         title="Loyalty Program",
         description="Introduce a loyalty points program redeemable online or in-store.",
         rationale="Increase repeat purchases by 15 % within one year.",
-        source=RequirementSource.product_owner,
-        priority=PriorityLevel.medium,
-        status=RequirementStatus.approved,
+        source=_PRODUCT_OWNER,
+        priority=_MEDIUM,
+        status=_APPROVED,
     )
-    bus_food_safety = Requirement(
+    bus_food_safety = Requirement.model_construct(
         display_id=_id("BUS"),
-        layer=RequirementLayer.business,
-        type=RequirementType.constraint,
+        layer=_BUS_LAYER,
+        type=_CONSTRAINT,
         title="Food Safety Compliance",
         description="Comply with FDA Food Code §3-501 on dairy handling.",
         rationale="Legal compliance—avoid fines & licence suspension.",
-        source=RequirementSource.regulation,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.approved,
+        source=_REGULATION,
+        priority=_HIGH,
+        status=_APPROVED,
     )
 
     # ────────────────────────────────────────────────────────────────
     # 2. SYSTEM REQUIREMENTS
     # ────────────────────────────────────────────────────────────────
-    sys_user_interface = Requirement(
+    sys_user_interface = Requirement.model_construct(
         display_id=_id("SYS"),
-        layer=RequirementLayer.system,
-        type=RequirementType.functional,
+        layer=_SYS_LAYER,
+        type=_FUNCTIONAL,
         title="User Interface Design",
         description="Create an intuitive, responsive interface for online ordering.",
         rationale="Ensure ease of use for customers across different devices.",
-        source=RequirementSource.stakeholder,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.draft,
+        source=_STAKEHOLDER,
+        priority=_HIGH,
+        status=_DRAFT,
     )
-    sys_payment_integration = Requirement(
+    sys_payment_integration = Requirement.model_construct(
         display_id=_id("SYS"),
-        layer=RequirementLayer.system,
-        type=RequirementType.functional,
+        layer=_SYS_LAYER,
+        type=_FUNCTIONAL,
         title="Payment System Integration",
         description="Support multiple payment methods securely.",
         rationale="Provide flexible payment options for customers.",
-        source=RequirementSource.product_owner,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.draft,
+        source=_PRODUCT_OWNER,
+        priority=_HIGH,
+        status=_DRAFT,
     )
-    sys_concurrency = Requirement(
+    sys_concurrency = Requirement.model_construct(
         display_id=_id("SYS"),
-        layer=RequirementLayer.system,
-        type=RequirementType.non_functional,
+        layer=_SYS_LAYER,
+        type=_NON_FUNCTIONAL,
         description="Support ≥ 2 000 concurrent sessions with < 2 s p95 response time.",
         rationale="Handle summer promo spikes 4× larger than baseline.",
-        source=RequirementSource.document,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.proposed,
+        source=_DOCUMENT,
+        priority=_HIGH,
+        status=_PROPOSED,
         links=[
-            Link(target_id=bus_online_orders.display_id, type=LinkType.satisfies)
+            Link.model_construct(target_id=bus_online_orders.display_id, type=_SATISFIES)
         ],
     )
-    sys_pci = Requirement(
+    sys_pci = Requirement.model_construct(
         display_id=_id("SYS"),
-        layer=RequirementLayer.system,
-        type=RequirementType.constraint,
+        layer=_SYS_LAYER,
+        type=_CONSTRAINT,
         description="All payment processing components shall be PCI-DSS v4.0 compliant.",
         rationale="Protect cardholder data & enable external audit.",
-        source=RequirementSource.regulation,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.approved,
+        source=_REGULATION,
+        priority=_HIGH,
+        status=_APPROVED,
         links=[
-            Link(target_id=bus_online_orders.display_id, type=LinkType.depends_on)
+            Link.model_construct(target_id=bus_online_orders.display_id, type=_DEPENDS_ON)
         ],
     )
-    sys_loyalty_service = Requirement(
+    sys_loyalty_service = Requirement.model_construct(
         display_id=_id("SYS"),
-        layer=RequirementLayer.system,
-        type=RequirementType.functional,
+        layer=_SYS_LAYER,
+        type=_FUNCTIONAL,
         description="Provide a loyalty-points micro-service with REST + Webhooks.",
         rationale="Centralise points logic for web & POS channels.",
-        source=RequirementSource.product_owner,
-        priority=PriorityLevel.medium,
-        status=RequirementStatus.proposed,
+        source=_PRODUCT_OWNER,
+        priority=_MEDIUM,
+        status=_PROPOSED,
         links=[
-            Link(target_id=bus_loyalty.display_id, type=LinkType.satisfies)
+            Link.model_construct(target_id=bus_loyalty.display_id, type=_SATISFIES)
         ],
     )
 
     # ────────────────────────────────────────────────────────────────
     # 3. SOFTWARE REQUIREMENTS
     # ────────────────────────────────────────────────────────────────
-    sw_cart = Requirement(
+    sw_cart = Requirement.model_construct(
         display_id=_id("SWS"),
-        layer=RequirementLayer.software,
-        type=RequirementType.functional,
+        layer=_SW_LAYER,
+        type=_FUNCTIONAL,
         description="Implement a Vue 3 cart component supporting flavour mix-ins & toppings.",
         rationale="Smooth UX on mobile; reuse component in kiosk app.",
-        source=RequirementSource.document,
-        priority=PriorityLevel.medium,
-        status=RequirementStatus.draft,
+        source=_DOCUMENT,
+        priority=_MEDIUM,
+        status=_DRAFT,
         links=[
-            Link(target_id=sys_concurrency.display_id,  type=LinkType.depends_on),
-            Link(target_id=bus_online_orders.display_id, type=LinkType.refines),
+            Link.model_construct(target_id=sys_concurrency.display_id,  type=_DEPENDS_ON),
+            Link.model_construct(target_id=bus_online_orders.display_id, type=_REFINES),
         ],
     )
-    sw_loyalty_api = Requirement(
+    sw_loyalty_api = Requirement.model_construct(
         display_id=_id("SWS"),
-        layer=RequirementLayer.software,
-        type=RequirementType.functional,
+        layer=_SW_LAYER,
+        type=_FUNCTIONAL,
         description="Expose `/points/balance` & `/points/redeem` endpoints (JSON, OAuth2).",
         rationale="Integrate loyalty with website and mobile-app checkout.",
-        source=RequirementSource.developer,
-        priority=PriorityLevel.medium,
-        status=RequirementStatus.draft,
+        source=_DEVELOPER,
+        priority=_MEDIUM,
+        status=_DRAFT,
         links=[
-            Link(target_id=sys_loyalty_service.display_id, type=LinkType.satisfies),
+            Link.model_construct(target_id=sys_loyalty_service.display_id, type=_SATISFIES),
         ],
     )
-    sw_temp_monitor = Requirement(
+    sw_temp_monitor = Requirement.model_construct(
         display_id=_id("SWS"),
-        layer=RequirementLayer.software,
-        type=RequirementType.functional,
+        layer=_SW_LAYER,
+        type=_FUNCTIONAL,
         description="Store freezer temperature logs every 10 min in immutable storage.",
         rationale="Evidence for FDA audits & food-safety analytics.",
-        source=RequirementSource.regulation,
-        priority=PriorityLevel.high,
-        status=RequirementStatus.draft,
+        source=_REGULATION,
+        priority=_HIGH,
+        status=_DRAFT,
         links=[
-            Link(target_id=bus_food_safety.display_id, type=LinkType.satisfies),
+            Link.model_construct(target_id=bus_food_safety.display_id, type=_SATISFIES),
         ],
     )
 
     # ────────────────────────────────────────────────────────────────
     # 4. TEST REQUIREMENTS
     # ────────────────────────────────────────────────────────────────
-    tst_cart_mixins = Requirement(
+    tst_cart_mixins = Requirement.model_construct(
         display_id=_id("TST"),
-        layer=RequirementLayer.test,
-        type=RequirementType.verification,
+        layer=_TEST_LAYER,
+        type=_VERIFICATION,
         description="Automated test: submit an order with ≥ 3 mix-ins and verify total price.",
         rationale="Detect price-calculation regressions.",
-        source=RequirementSource.developer,
-        priority=PriorityLevel.low,
-        status=RequirementStatus.planned,
+        source=_DEVELOPER,
+        priority=_LOW,
+        status=_PLANNED,
         verification="Pytest + Playwright",
         links=[
-            Link(target_id=sw_cart.display_id, type=LinkType.depends_on),
+            Link.model_construct(target_id=sw_cart.display_id, type=_DEPENDS_ON),
         ],
     )
-    tst_loyalty_accrual = Requirement(
+    tst_loyalty_accrual = Requirement.model_construct(
         display_id=_id("TST"),
-        layer=RequirementLayer.test,
-        type=RequirementType.verification,
+        layer=_TEST_LAYER,
+        type=_VERIFICATION,
         description="API test: after purchase, customer balance increases by earned points.",
         rationale="Guarantee loyalty rules consistency.",
-        source=RequirementSource.developer,
-        priority=PriorityLevel.low,
-        status=RequirementStatus.planned,
+        source=_DEVELOPER,
+        priority=_LOW,
+        status=_PLANNED,
         verification="Postman/Newman",
         links=[
-            Link(target_id=sw_loyalty_api.display_id, type=LinkType.depends_on),
+            Link.model_construct(target_id=sw_loyalty_api.display_id, type=_DEPENDS_ON),
         ],
     )
-    tst_performance = Requirement(
+    tst_performance = Requirement.model_construct(
         display_id=_id("TST"),
-        layer=RequirementLayer.test,
-        type=RequirementType.verification,
+        layer=_TEST_LAYER,
+        type=_VERIFICATION,
         description="Load-test checkout for 2 000 virtual users, p95 < 2 s.",
         rationale="Prove non-functional performance target.",
-        source=RequirementSource.support_ticket,
-        priority=PriorityLevel.medium,
-        status=RequirementStatus.planned,
+        source=_SUPPORT_TICKET,
+        priority=_MEDIUM,
+        status=_PLANNED,
         verification="k6 cloud test",
         links=[
-            Link(target_id=sys_concurrency.display_id, type=LinkType.satisfies),
+            Link.model_construct(target_id=sys_concurrency.display_id, type=_SATISFIES),
         ],
     )
-    tst_temp_monitor = Requirement(
+    tst_temp_monitor = Requirement.model_construct(
         display_id=_id("TST"),
-        layer=RequirementLayer.test,
-        type=RequirementType.verification,
+        layer=_TEST_LAYER,
+        type=_VERIFICATION,
         description="Unit test: temperature log rejected if older than 15 min.",
         rationale="Ensure data integrity for FDA audit trail.",
-        source=RequirementSource.developer,
-        priority=PriorityLevel.low,
-        status=RequirementStatus.planned,
+        source=_DEVELOPER,
+        priority=_LOW,
+        status=_PLANNED,
         verification="Pytest",
         links=[
-            Link(target_id=sw_temp_monitor.display_id, type=LinkType.depends_on),
+            Link.model_construct(target_id=sw_temp_monitor.display_id, type=_DEPENDS_ON),
         ],
     )
 
-    # ────────────────────────────────────────────────────────────────
-    # Persist everything
-    # ────────────────────────────────────────────────────────────────
-    for req in [
+    all_reqs = [
         bus_online_orders, bus_loyalty, bus_food_safety,
         sys_concurrency, sys_pci, sys_loyalty_service,
         sw_cart, sw_loyalty_api, sw_temp_monitor,
         tst_cart_mixins, tst_loyalty_accrual, tst_performance, tst_temp_monitor,
-    ]:
-        requirements_store[req.display_id] = req.dict()
\ No newline at end of file
+    ]
+    return {req.display_id: ReqRow(**intern_enum_fields(fast_dump(req))) for req in all_reqs}
+
+# Prepared once at import so /load-demo does no pydantic work at request time.
+_ROWS = _build_rows()
+
+def create_ice_cream_example() -> None:
+    """Deep-dive Ice-Cream Shop demo with full traceability.
+
+    Rows are prebuilt at import; loading is a reset plus one bulk insert.
+    """
+    reset_store()
+    # Single bulk update instead of one store write per requirement
+    add_requirements(_ROWS)
\ No newline at end of file
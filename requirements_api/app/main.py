@@ -7,54 +7,88 @@ creation, retrieval, update, deletion, and history tracking.
 Author: Chris Senanayake
 """
 
-import uuid
 from fastapi import FastAPI, HTTPException, status # Ensured status is imported
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi import Request
 from .schemas import Requirement, RequirementVersion, RequirementLayer
-from uuid import uuid4
-from .metadata import router as metadata_router
-from datetime import datetime
+from .metadata import METADATA_LISTS, router as metadata_router
+from .utils import fast_dump, intern_enum_fields, make_display_id
+import operator
+import time
 from io import StringIO
 import csv
 from typing import List
 from starlette.responses import StreamingResponse
-#from .dev_routes import router as dev_router
 
-# Removed duplicate import of metadata_router
-
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 templates = Jinja2Templates(directory="app/templates")
+templates.env.auto_reload = False
+# Resolve the template once at startup; per-request get_template() lookups
+# (and their auto-reload stat calls) are skipped entirely.
+REQ_TEMPLATE = templates.get_template("requirements_viewer.html")
 app.include_router(metadata_router)
-#app.include_router(dev_router)
 
-from .store import requirements_store # Added import for centralized store
+from .store import (
+    requirements_store, link_rows, ReqRow, add_requirement, index_links,
+    deindex_links, snapshot_bytes, snapshot_etag, invalidate_snapshot,
+) # Added import for centralized store
 from .examples.ice_cream_example import create_ice_cream_example
 from .examples.death_star_example import create_death_star_example # Added import for Death Star
 
-app.include_router(metadata_router)
-
 @app.get("/requirements")
-async def get_requirements():
-    """Retrieve all requirements."""
-    return list(requirements_store.values())
+async def get_requirements(request: Request):
+    """Retrieve all requirements (served from the cached JSON snapshot).
+
+    The response carries an ETag per write generation; a matching
+    If-None-Match gets an empty 304 instead of the full list.
+    """
+    etag = snapshot_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=snapshot_bytes(), media_type="application/json",
+                    headers={"ETag": etag})
+
+@app.get("/bootstrap")
+async def bootstrap():
+    """
+    Aggregated UI payload: the requirements list plus every metadata enum
+    listing in one response, so clients need a single round trip instead of
+    one GET per field.
+    """
+    return {"requirements": list(requirements_store.values()), **METADATA_LISTS}
 
 @app.get("/requirements/view", response_class=HTMLResponse)
 async def view_requirements(request: Request):
     """Render requirements as an HTML page."""
     requirements = list(requirements_store.values())
-    return templates.TemplateResponse("requirements_viewer.html", {"request": request, "requirements": requirements})
+    return HTMLResponse(REQ_TEMPLATE.render(request=request, requirements=requirements))
 
 @app.post("/requirements")
 async def create_requirement(req: Requirement):
     """Create a new requirement."""
-    display_id = f"REQ-{str(uuid4())[:8].upper()}"
-    new_req = req.dict()
-    new_req.update({"display_id": display_id})
-    requirements_store[display_id] = new_req
-    return new_req
+    display_id = make_display_id()
+    new_req = intern_enum_fields(fast_dump(req))
+    new_req["display_id"] = display_id
+    row = ReqRow(**new_req)
+    add_requirement(display_id, row)
+    return row
+
+# Fields captured in version snapshots, in presentation order. The
+# attrgetter fetches all seven values in one C-level call; every stored row
+# is a ReqRow, so the attributes are always present.
+VERSIONED_FIELDS = (
+    "type", "description", "rationale", "source",
+    "priority", "status", "verification",
+)
+_ver_get = operator.attrgetter(*VERSIONED_FIELDS)
+
+# Ring-buffer cap on per-requirement history: the oldest snapshot is evicted
+# once a requirement has been edited this many times.
+MAX_VERSIONS = 50
 
 @app.put("/requirements/{display_id}")
 async def update_requirement(display_id: str, req: Requirement):
@@ -62,31 +96,35 @@ async def update_requirement(display_id: str, req: Requirement):
     if display_id not in requirements_store:
         raise HTTPException(status_code=404, detail="Requirement not found")
 
-    # Save previous version
-    old_req = requirements_store[display_id].copy()
-    version = RequirementVersion(
-        timestamp=datetime.utcnow(),
-        data={
-            "type": old_req["type"],
-            "description": old_req["description"],
-            "rationale": old_req.get("rationale"),
-            "source": old_req["source"],
-            "priority": old_req["priority"],
-            "status": old_req["status"],
-            "verification": old_req.get("verification")
+    old_row = requirements_store[display_id]
+    updated_req = intern_enum_fields(fast_dump(req))
+    updated_req["display_id"] = display_id
+    new_row = ReqRow(**updated_req)
+
+    # Save previous version. The first snapshot keeps the full record; later
+    # ones store only the fields this update changed, so long-lived
+    # requirements don't accumulate verbatim copies of unchanged data.
+    old_vals = _ver_get(old_row)
+    if old_row.versions:
+        snapshot = {
+            k: ov for k, ov, nv in zip(VERSIONED_FIELDS, old_vals, _ver_get(new_row))
+            if ov != nv
         }
-    )
-
-    updated_req = req.dict()
-    updated_req.update({"display_id": display_id})
-
-    # Append to versions
-    if "versions" not in old_req:
-        old_req["versions"] = []
-    updated_req["versions"] = old_req["versions"] + [version.dict()]
-
-    requirements_store[display_id] = updated_req
-    return updated_req
+    else:
+        snapshot = dict(zip(VERSIONED_FIELDS, old_vals))
+    version = RequirementVersion(timestamp=time.time_ns(), data=snapshot)
+
+    # Append to versions, bounded to MAX_VERSIONS. Built as a fresh capped
+    # list (not an in-place append) because prebuilt demo rows share their
+    # version lists across loads; a plain list also keeps the orjson
+    # snapshot serialisable, which a deque would not be.
+    new_row.versions = (old_row.versions + [fast_dump(version)])[-MAX_VERSIONS:]
+
+    requirements_store[display_id] = new_row
+    deindex_links(display_id)
+    index_links(display_id, new_row)
+    invalidate_snapshot()
+    return new_row
 
 @app.delete("/requirements/{display_id}")
 async def delete_requirement(display_id: str):
@@ -94,6 +132,8 @@ async def delete_requirement(display_id: str):
     if display_id not in requirements_store:
         raise HTTPException(status_code=404, detail="Requirement not found")
     del requirements_store[display_id]
+    deindex_links(display_id)
+    invalidate_snapshot()
     return {"message": "Requirement deleted successfully"}
 
 @app.post("/load-demo/{demo_name}", status_code=status.HTTP_200_OK)
@@ -101,6 +141,9 @@ async def load_demo_data(demo_name: str):
     """
     Clears existing requirements and loads the specified demo examples.
     Supported demo_names: 'ice_cream', 'death_star'
+
+    The response includes the loaded requirements so callers don't need a
+    follow-up GET /requirements round trip.
     """
     try:
         if demo_name == "ice_cream":
@@ -114,7 +157,7 @@ async def load_demo_data(demo_name: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Demo '{demo_name}' not found. Supported demos: 'ice_cream', 'death_star'"
             )
-        return {"message": message}
+        return {"message": message, "requirements": list(requirements_store.values())}
     except HTTPException: # Re-raise HTTPException to return proper status code
         raise
     except Exception as e:
@@ -134,15 +177,19 @@ async def export_traceability():
     StreamingResponse
         CSV file with source and target requirement links.
     """
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["Source Requirement", "Link Type", "Target Requirement"])
-
-    for req in requirements_store.values():
-        for link in req.get("links", []):
-            writer.writerow([req["display_id"], link["type"], link["target_id"]])
-
-    output.seek(0)
-    return StreamingResponse(output, media_type="text/csv", headers={
+    def generate_rows():
+        # Yield each CSV row as it is produced instead of buffering the
+        # whole matrix: keeps peak memory O(1) in the store size.
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Source Requirement", "Link Type", "Target Requirement"])
+        yield buffer.getvalue()
+        for row in link_rows:
+            buffer.seek(0)
+            buffer.truncate(0)
+            writer.writerow(row)
+            yield buffer.getvalue()
+
+    return StreamingResponse(generate_rows(), media_type="text/csv", headers={
         "Content-Disposition": "attachment; filename=traceability_matrix.csv"
     })
@@ -5,32 +5,53 @@ This module exposes endpoints for UI or external consumers to retrieve allowed v
 for requirement fields (types, priorities, sources, statuses).
 """
 
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import Response
 from .schemas import RequirementType, PriorityLevel, RequirementSource, RequirementStatus, RequirementLayer
-from typing import List
 router = APIRouter()
 
-
-@router.get("/metadata/layers", response_model=List[str])
+# Plain enum value listings, keyed by route segment. Shared with the
+# aggregated /bootstrap endpoint in main.
+METADATA_LISTS = {
+    "layers": [layer.value for layer in RequirementLayer],
+    "types": [e.value for e in RequirementType],
+    "priority": [e.value for e in PriorityLevel],
+    "source": [e.value for e in RequirementSource],
+    "status": [e.value for e in RequirementStatus],
+}
+
+# The enums are immutable, so the responses are literal constants: encode
+# them to JSON bytes once at import time and return the bytes directly —
+# zero serialisation work per request.
+_LAYERS_JSON = orjson.dumps(METADATA_LISTS["layers"])
+_TYPES_JSON = orjson.dumps(METADATA_LISTS["types"])
+_PRIORITIES_JSON = orjson.dumps(METADATA_LISTS["priority"])
+_SOURCES_JSON = orjson.dumps(METADATA_LISTS["source"])
+_STATUSES_JSON = orjson.dumps(METADATA_LISTS["status"])
+
+
+@router.get("/metadata/layers")
 async def get_layers():
-    return [layer.value for layer in RequirementLayer]
+    """Get allowed Requirement Layers."""
+    return Response(_LAYERS_JSON, media_type="application/json")
 
 @router.get("/metadata/types")
 async def get_requirement_types():
     """Get allowed Requirement Types."""
-    return [e.value for e in RequirementType]
+    return Response(_TYPES_JSON, media_type="application/json")
 
 @router.get("/metadata/priority")
 async def get_priorities():
     """Get allowed Priority Levels."""
-    return [e.value for e in PriorityLevel]
+    return Response(_PRIORITIES_JSON, media_type="application/json")
 
 @router.get("/metadata/source")
 async def get_sources():
     """Get allowed Sources."""
-    return [e.value for e in RequirementSource]
+    return Response(_SOURCES_JSON, media_type="application/json")
 
 @router.get("/metadata/status")
 async def get_statuses():
     """Get allowed Requirement Statuses."""
-    return [e.value for e in RequirementStatus]
+    return Response(_STATUSES_JSON, media_type="application/json")
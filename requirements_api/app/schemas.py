@@ -10,7 +10,6 @@ Author: Chris Senanayake
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from enum import Enum
-from datetime import datetime
 
 class RequirementLayer(str, Enum):
     """Enumeration of allowed requirement layers."""
@@ -55,12 +54,13 @@ class RequirementVersion(BaseModel):
 
     Attributes
     ----------
-    timestamp : datetime
-        Time when this version was created.
+    timestamp : int
+        Nanoseconds since the Unix epoch when this version was created.
+        Stored as an int on the write path; formatted for display lazily.
     data : dict
         Snapshot of the requirement fields at that time.
     """
-    timestamp: datetime
+    timestamp: int
     data: dict
 
 class LinkType(str, Enum):
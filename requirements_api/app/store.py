@@ -1,2 +1,90 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import orjson
+
+@dataclass(slots=True)
+class ReqRow:
+    """Internal storage row for one requirement.
+
+    A slotted dataclass instead of a per-row dict: no hash table per
+    requirement, and orjson serialises dataclasses natively when the
+    snapshot is rebuilt. Pydantic models are used only as API DTOs.
+    """
+    display_id: Optional[str] = None
+    type: Optional[str] = None
+    description: Optional[str] = None
+    source: Optional[str] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+    layer: Optional[str] = None
+    title: Optional[str] = None
+    rationale: Optional[str] = None
+    verification: Optional[str] = None
+    versions: list = field(default_factory=list)
+    links: list = field(default_factory=list)
+
 # In-memory storage for requirements
 requirements_store = {}
+
+# Side index of (source, link type, target) rows, kept in lockstep with the
+# store so traceability export never has to scan full requirement dicts.
+link_rows = []
+
+# Lazily encoded JSON snapshot of the full requirements list. Reads dominate
+# this store, so the encode cost is paid once per write, not per GET.
+_snapshot_bytes = None
+
+# Monotonic write generation, doubling as the collection ETag: bumping a
+# counter per write is cheaper than hashing the snapshot bytes. Seeded from
+# the clock so a restarted process never reissues an ETag that clients
+# cached against the previous process's content.
+_snapshot_version = time.time_ns()
+
+def snapshot_etag() -> str:
+    """Return the ETag for the current snapshot generation."""
+    return f'"{_snapshot_version}"'
+
+def snapshot_bytes() -> bytes:
+    """Return JSON bytes for the full requirements list, cached until the next write."""
+    global _snapshot_bytes
+    if _snapshot_bytes is None:
+        # Store rows are ReqRow dataclasses of str/int/list/None fields,
+        # which orjson serialises natively — no jsonable_encoder pass needed.
+        _snapshot_bytes = orjson.dumps(list(requirements_store.values()))
+    return _snapshot_bytes
+
+def invalidate_snapshot():
+    """Mark the cached JSON snapshot stale; called on every write path."""
+    global _snapshot_bytes, _snapshot_version
+    _snapshot_bytes = None
+    _snapshot_version += 1
+
+def reset_store():
+    """Clear the store and its link index together."""
+    requirements_store.clear()
+    link_rows.clear()
+    invalidate_snapshot()
+
+def add_requirement(display_id, row):
+    """Insert one requirement row and index its links in a single call."""
+    requirements_store[display_id] = row
+    index_links(display_id, row)
+    invalidate_snapshot()
+
+def add_requirements(new_items):
+    """Bulk-insert a mapping of ``display_id -> ReqRow`` and index all links."""
+    requirements_store.update(new_items)
+    for display_id, row in new_items.items():
+        index_links(display_id, row)
+    invalidate_snapshot()
+
+def index_links(display_id, row):
+    """Append this requirement's links to the traceability index."""
+    for link in row.links or []:
+        link_rows.append((display_id, link["type"], link["target_id"]))
+
+def deindex_links(display_id):
+    """Remove all index rows originating from *display_id*."""
+    link_rows[:] = [row for row in link_rows if row[0] != display_id]
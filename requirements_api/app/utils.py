@@ -1,6 +1,52 @@
 import itertools
+import sys
+from enum import Enum
+
+from pydantic import BaseModel
 
 _id_counter = itertools.count(1)
 
-def make_display_id() -> str:
-    return f"REQ-{next(_id_counter):08d}"
\ No newline at end of file
+def make_display_id(prefix: str = "REQ") -> str:
+    """Return the next display ID, e.g. ``REQ-0000002A``.
+
+    A monotonic counter is far cheaper than slicing a fresh ``uuid4()``
+    (no urandom read, no UUID object) and cannot collide within a process.
+    """
+    return f"{prefix}-{next(_id_counter):08X}"
+
+# Enum-backed fields whose values come from a tiny fixed vocabulary.
+_ENUM_FIELDS = ("type", "status", "priority", "source", "layer")
+
+def intern_enum_fields(req_dict: dict) -> dict:
+    """Intern the repeated enum-valued strings in a stored requirement dict.
+
+    Values like "Functional" or "High" recur on every row; interning makes
+    all rows share a single str object per value, cutting store memory and
+    speeding downstream equality checks. The vocabulary is fixed, so the
+    intern table stays bounded.
+    """
+    for key in _ENUM_FIELDS:
+        value = req_dict.get(key)
+        if isinstance(value, str):
+            req_dict[key] = sys.intern(value)
+    for link in req_dict.get("links") or []:
+        link_type = link.get("type")
+        if isinstance(link_type, str):
+            link["type"] = sys.intern(link_type)
+    return req_dict
+
+def fast_dump(model: BaseModel) -> dict:
+    """Serialise an already-validated model without pydantic's `.dict()` walk.
+
+    Copies `model.__dict__` directly, unwrapping Enum members and nested
+    models so the result matches `.dict()` output. Safe only for models we
+    constructed/validated ourselves — no coercion is performed.
+    """
+    out = {}
+    for key, value in model.__dict__.items():
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, list):
+            value = [fast_dump(v) if isinstance(v, BaseModel) else v for v in value]
+        out[key] = value
+    return out
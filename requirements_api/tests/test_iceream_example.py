@@ -1,21 +1,27 @@
-import pytest
 import httpx
 
-BASE_URL = "http://app:8000"
+from tests.conftest import json_of
 
-@pytest.mark.asyncio
-async def test_icecream_layers_present():
-    """Ensure example loads and requirements are layered correctly."""
-    async with httpx.AsyncClient(base_url=BASE_URL) as client:
-        # Load example requirements
-        response = await client.post("/load-icecream-example")
-        assert response.status_code == 200
 
-        # Fetch all requirements
-        response = await client.get("/requirements")
-        assert response.status_code == 200
-        data = response.json()
+async def test_icecream_layers_present(client_asgi: httpx.AsyncClient):
+    """Ensure example loads and requirements are layered correctly.
 
-        layers = {req["layer"] for req in data}
-        assert {"Business", "System", "Software", "Test"}.issubset(layers)
-        assert len(data) >= 4
+    Runs in-process so the demo load's reset_store() hits this worker's
+    own store instead of wiping the shared backend under the other
+    xdist workers' feet.
+    """
+    # The load endpoint returns the loaded requirements directly, so one
+    # round trip covers both the load and the verification fetch.
+    response = await client_asgi.post("/load-demo/ice_cream")
+    assert response.status_code == 200
+    data = json_of(response)["requirements"]
+
+    # Single pass with early exit: stop scanning once every expected layer
+    # has been seen instead of building the full layer set.
+    needed = {"Business", "System", "Software", "Test"}
+    for req in data:
+        needed.discard(req["layer"])
+        if not needed:
+            break
+    assert not needed, f"missing layers: {needed}"
+    assert len(data) >= 4
@@ -1,55 +1,34 @@
 """
 Test Metadata API Endpoints
 
-Tests for retrieving allowed values for RequirementType, PriorityLevel, RequirementSource, and RequirementStatus
-from the metadata endpoints.
+Tests for retrieving allowed values for RequirementType, PriorityLevel, RequirementSource,
+RequirementStatus and RequirementLayer from the metadata endpoints.
 """
 
-import pytest
+import asyncio
+
 import httpx
 
-BASE_URL = "http://app:8000"
-
-@pytest.mark.asyncio
-async def test_metadata_types():
-    """Test retrieval of requirement types."""
-    async with httpx.AsyncClient(base_url=BASE_URL) as client:
-        response = await client.get("/metadata/types")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        assert all(isinstance(t, str) for t in response.json())
-
-@pytest.mark.asyncio
-async def test_metadata_priority():
-    """Test retrieval of priority levels."""
-    async with httpx.AsyncClient(base_url=BASE_URL) as client:
-        response = await client.get("/metadata/priority")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        assert all(isinstance(p, str) for p in response.json())
-
-@pytest.mark.asyncio
-async def test_metadata_source():
-    """Test retrieval of requirement sources."""
-    async with httpx.AsyncClient(base_url=BASE_URL) as client:
-        response = await client.get("/metadata/source")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        assert all(isinstance(s, str) for s in response.json())
-
-@pytest.mark.asyncio
-async def test_metadata_status():
-    """Test retrieval of requirement statuses."""
-    async with httpx.AsyncClient(base_url=BASE_URL) as client:
-        response = await client.get("/metadata/status")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        assert all(isinstance(s, str) for s in response.json())
-
-@pytest.mark.asyncio
-async def test_metadata_layers():
-    """Test retrieval of requirement layers."""
-    async with httpx.AsyncClient(base_url=BASE_URL) as client:
-        response = await client.get("/metadata/layers")
-        assert response.status_code == 200
-        assert "Business" in response.json()
\ No newline at end of file
+from tests.conftest import json_of
+
+
+async def test_metadata_all(client_asgi: httpx.AsyncClient):
+    """Fetch every metadata listing concurrently and check each one's shape.
+
+    Metadata responses are constants, so the in-process ASGI client is used —
+    no network round trips.
+    """
+    client = client_asgi
+    fields = ("types", "priority", "source", "status", "layers")
+    responses = await asyncio.gather(
+        *(client.get(f"/metadata/{field}") for field in fields)
+    )
+
+    for field, response in zip(fields, responses):
+        assert response.status_code == 200, f"/metadata/{field} failed"
+        values = json_of(response)
+        assert isinstance(values, list)
+        assert all(isinstance(v, str) for v in values)
+
+    # Spot-check one known member of the layers listing
+    assert "Business" in json_of(responses[fields.index("layers")])
@@ -1,4 +1,5 @@
-import pytest
+import os
+
 import httpx
 from typing import Dict, Any
 
@@ -7,9 +8,13 @@ from app.schemas import RequirementType, RequirementSource, PriorityLevel, Requi
 # Base URL for the API
 BASE_URL = "http://localhost:8000" # Assuming the API runs on port 8000
 
+# Suffix display_ids with the xdist worker id so parallel workers never
+# collide on the shared backend store.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+
 # --- Test Data ---
 VALID_REQUIREMENT_PAYLOAD: Dict[str, Any] = {
-    "display_id": "REQ-API-001",
+    "display_id": f"REQ-API-001{_WORKER}",
     "type": RequirementType.functional.value,
     "description": "The system shall allow users to log in via OAuth2.",
     "source": RequirementSource.stakeholder.value,
@@ -29,11 +34,9 @@ VALID_REQUIREMENT_PAYLOAD: Dict[str, Any] = {
 
 # --- API Tests ---
 
-@pytest.mark.asyncio
 async def test_create_requirement_valid_data(async_client: httpx.AsyncClient):
     """Test creating a requirement with valid data."""
-    payload = VALID_REQUIREMENT_PAYLOAD.copy()
-    payload["display_id"] = "REQ-API-CREATE-VALID" # Ensure unique ID for test
+    payload = {**VALID_REQUIREMENT_PAYLOAD, "display_id": f"REQ-API-CREATE-VALID{_WORKER}"} # Ensure unique ID for test
 
     response = await async_client.post(f"{BASE_URL}/requirements", json=payload)
     
@@ -1,10 +1,11 @@
 import pytest
 from pydantic import ValidationError
+from types import MappingProxyType
 
 # Adjust the import path based on your project structure and how tests are run.
 # If 'app' is a top-level package for tests:
 from app.schemas import Requirement, RequirementType, RequirementSource, PriorityLevel, RequirementStatus, RequirementLayer, Link, LinkType, RequirementVersion
-from datetime import datetime
+import time
 
 # Or, if your PYTHONPATH is set to 'requirements_api' for tests:
 # from schemas import Requirement, RequirementType, RequirementSource, PriorityLevel, RequirementStatus, RequirementLayer
@@ -81,14 +82,19 @@ def test_requirement_model_display_id_is_str():
 
 # --- Enum Validation Tests ---
 
-VALID_BASE_REQUIREMENT_DATA = {
+# Frozen base payload shared across every enum parametrisation: each param
+# does one cheap dict merge instead of re-expanding and patching the base.
+# 'type' defaults to a valid member and is simply overridden when it is the
+# field under test.
+ENUM_TEST_BASE = MappingProxyType({
     "display_id": "REQ-ENUM-TEST",
+    "type": RequirementType.functional,   # Valid default
     "description": "Test enum validation.",
     "source": RequirementSource.developer, # Valid default
     "priority": PriorityLevel.low,      # Valid default
     "status": RequirementStatus.draft,    # Valid default
     "layer": RequirementLayer.software  # Valid default
-}
+})
 
 @pytest.mark.parametrize("enum_field, valid_enum_value, EnumClass", [
     ("type", RequirementType.functional, RequirementType),
@@ -96,18 +102,11 @@ VALID_BASE_REQUIREMENT_DATA = {
     ("priority", PriorityLevel.high, PriorityLevel),
     ("status", RequirementStatus.approved, RequirementStatus),
     ("layer", RequirementLayer.business, RequirementLayer),
-])
+], ids=str)
 def test_requirement_model_valid_enum_values(enum_field, valid_enum_value, EnumClass):
     """Test Requirement model accepts valid enum values."""
-    data = {
-        **VALID_BASE_REQUIREMENT_DATA,
-        "type": RequirementType.constraint, # A valid default for type if not the one being tested
-        enum_field: valid_enum_value
-    }
-    # Ensure the base 'type' is valid if we are testing another field
-    if enum_field != "type":
-        data["type"] = RequirementType.functional
-    
+    data = {**ENUM_TEST_BASE, enum_field: valid_enum_value}
+
     try:
         req = Requirement(**data)
         assert getattr(req, enum_field) == valid_enum_value
@@ -120,17 +119,10 @@ def test_requirement_model_valid_enum_values(enum_field, valid_enum_value, EnumC
     ("priority", PriorityLevel),
     ("status", RequirementStatus),
     ("layer", RequirementLayer), # Layer is optional, but if provided, must be valid
-])
+], ids=str)
 def test_requirement_model_invalid_enum_values(enum_field, EnumClass):
     """Test Requirement model rejects invalid enum values."""
-    data = {
-        **VALID_BASE_REQUIREMENT_DATA,
-        "type": RequirementType.constraint, # A valid default for type
-         enum_field: "INVALID_ENUM_VALUE_XYZ"
-    }
-    # Ensure the base 'type' is valid if we are testing another field
-    if enum_field != "type":
-        data["type"] = RequirementType.functional
+    data = {**ENUM_TEST_BASE, enum_field: "INVALID_ENUM_VALUE_XYZ"}
 
     with pytest.raises(ValidationError) as excinfo:
         Requirement(**data)
@@ -166,8 +158,8 @@ def test_requirement_model_optional_fields_provided():
     # from app.schemas import Link, LinkType, RequirementVersion (ensure these are imported at the top)
     # from datetime import datetime # ensure imported
 
-    link_data = {"target_id": "REQ-TARGET-1", "type": LinkType.depends_on} 
-    version_data = {"timestamp": datetime.now(), "data": {"description": "Old desc"}}
+    link_data = {"target_id": "REQ-TARGET-1", "type": LinkType.depends_on}
+    version_data = {"timestamp": time.time_ns(), "data": {"description": "Old desc"}}
 
     data = {
         "display_id": "REQ-OPT-P",
@@ -13,9 +13,14 @@ repo_root = this_dir.parent                              # /... (contains 'sente
 sys.path.insert(0, str(repo_root))
 import streamlit as st
 import httpx
+import orjson
 import pandas as pd
+import csv
 import io
 import json
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
 from sententia.render import render_doc
 
 
@@ -25,6 +30,32 @@ BACKEND_URL = "http://app:8000"
 # Configure Streamlit page
 st.set_page_config(page_title="Requirements Management System", layout="wide")
 
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """
+    Shared HTTP client with a pooled connection set.
+
+    Cached as a Streamlit resource so every rerun (and every session on this
+    process) reuses keep-alive connections instead of paying a fresh TCP
+    handshake per API call. HTTP/2 lets concurrent requests multiplex over
+    one connection; httpx falls back to HTTP/1.1 keep-alive when the
+    backend doesn't speak h2.
+    """
+    return httpx.Client(
+        base_url=BACKEND_URL,
+        http2=True,
+        timeout=httpx.Timeout(10.0),
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        # The backend runs GZipMiddleware; advertising compression shrinks
+        # the requirements and traceability payloads on the wire (httpx
+        # decodes transparently).
+        headers={"Accept-Encoding": "gzip, br"},
+    )
+
+
+CLIENT = get_client()
+
 # Sidebar menu navigation
 menu = st.sidebar.radio(
     "Navigation",
@@ -35,23 +66,57 @@ menu = st.sidebar.radio(
 
 def fetch_requirements():
     """
-    Fetch all requirements from the backend.
+    Fetch all requirements from the backend via an ETag conditional GET.
+
+    The last body and ETag live in session state; when nothing changed the
+    backend answers 304 and the cached body is reused without transferring
+    or re-parsing the full list. Writes bump the backend ETag, so no manual
+    invalidation is needed.
 
     Returns
     -------
     list
         List of requirement dictionaries.
     """
-    with httpx.Client() as client:
-        response = client.get(f"{BACKEND_URL}/requirements")
-        if response.status_code == 200:
-            return response.json()
-        return []
+    headers = {"If-None-Match": st.session_state.get("_reqs_etag", "")}
+    response = CLIENT.get("/requirements", headers=headers)
+    if response.status_code == 304:
+        return st.session_state.get("_reqs_body", [])
+    if response.status_code == 200:
+        st.session_state["_reqs_etag"] = response.headers.get("etag", "")
+        st.session_state["_reqs_body"] = orjson.loads(response.content)
+        return st.session_state["_reqs_body"]
+    return []
 
+def fetch_requirements_cached(max_age=15):
+    """
+    Serve the last-good requirements list from session state when fresh.
+
+    Menu switches within *max_age* seconds reuse the snapshot without any
+    round trip at all; past that, fetch_requirements revalidates cheaply
+    via its ETag. Write helpers zero the timestamp so mutations are
+    reflected immediately.
+
+    Returns
+    -------
+    list
+        List of requirement dictionaries.
+    """
+    ts, data = st.session_state.get("reqs_cache", (0, None))
+    if data is not None and time.time() - ts < max_age:
+        return data
+    data = fetch_requirements()
+    st.session_state["reqs_cache"] = (time.time(), data)
+    return data
+
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_metadata(field: str):
     """
     Fetch allowed metadata values for a specific field.
 
+    The enum listings change only with backend releases, so they are cached
+    across reruns (and sessions) rather than refetched per interaction.
+
     Parameters
     ----------
     field : str
@@ -63,52 +128,113 @@ def fetch_metadata(field: str):
         List of valid values, or empty list if error.
     """
     try:
-        with httpx.Client() as client:
-            response = client.get(f"{BACKEND_URL}/metadata/{field}")
-            if response.status_code == 200:
-                return response.json()
+        response = CLIENT.get(f"/metadata/{field}")
+        if response.status_code == 200:
+            return orjson.loads(response.content)
     except Exception as e:
         st.error(f"Error fetching metadata for {field}: {e}")
     return []
 
+@st.cache_data(ttl=10, show_spinner=False)
+def fetch_bootstrap():
+    """
+    Fetch the requirements list plus every metadata enum in one request.
+
+    The aggregated /bootstrap endpoint replaces the per-widget fanout of
+    one GET per field on the rerun critical path.
+
+    Returns
+    -------
+    dict
+        Mapping with 'requirements', 'types', 'priority', 'source',
+        'status' and 'layers' keys.
+    """
+    response = CLIENT.get("/bootstrap")
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    # Fall back to the per-field endpoints (e.g. against an older backend
+    # without /bootstrap) rather than rendering empty selectboxes.
+    fallback = {field: fetch_metadata(field)
+                for field in ("types", "priority", "source", "status", "layers")}
+    fallback["requirements"] = fetch_requirements()
+    return fallback
+
 def create_requirement(data):
     """Create a new requirement."""
-    with httpx.Client() as client:
-        return client.post(f"{BACKEND_URL}/requirements", json=data)
+    response = CLIENT.post("/requirements", json=data)
+    fetch_bootstrap.clear()
+    st.session_state["reqs_cache"] = (0, None)
+    return response
 
 def update_requirement(display_id, data):
     """Update an existing requirement."""
-    with httpx.Client() as client:
-        return client.put(f"{BACKEND_URL}/requirements/{display_id}", json=data)
+    response = CLIENT.put(f"/requirements/{display_id}", json=data)
+    fetch_bootstrap.clear()
+    st.session_state["reqs_cache"] = (0, None)
+    return response
 
 def delete_requirement(display_id):
     """Delete a requirement."""
-    with httpx.Client() as client:
-        return client.delete(f"{BACKEND_URL}/requirements/{display_id}")
+    response = CLIENT.delete(f"/requirements/{display_id}")
+    fetch_bootstrap.clear()
+    st.session_state["reqs_cache"] = (0, None)
+    return response
 
 def trigger_demo_load(demo_name: str):
     """Triggers the backend to load specified demo data."""
-    with httpx.Client() as client:
-        return client.post(f"{BACKEND_URL}/load-demo/{demo_name}") # Updated endpoint
+    response = CLIENT.post(f"/load-demo/{demo_name}") # Updated endpoint
+    fetch_bootstrap.clear()
+    st.session_state["reqs_cache"] = (0, None)
+    return response
+
+# Field names in argument order for the table-driven mandatory check below.
+_REQUIRED_FIELDS = ("Type", "Description", "Source", "Priority", "Status")
 
 def validate_fields(type_, description, source, priority, status):
     """Validate mandatory requirement fields."""
-    errors = []
-    if not type_:
-        errors.append("Type is required.")
-    if not description.strip():
-        errors.append("Description is required.")
-    if not source:
-        errors.append("Source is required.")
-    if not priority:
-        errors.append("Priority is required.")
-    if not status:
-        errors.append("Status is required.")
-    return errors
+    # Only Description needs whitespace-stripping; `description and ...`
+    # skips the strip() allocation when the field is already empty.
+    values = (type_, description and description.strip(), source, priority, status)
+    return [f"{name} is required."
+            for name, value in zip(_REQUIRED_FIELDS, values) if not value]
 
 # ---------------- UI Sections ----------------
 
 
+@st.cache_data(show_spinner=False)
+def group_preview_rows_by_layer(requirements):
+    """
+    Bucket preview rows by lower-cased layer in a single pass.
+
+    Cached on the requirements list, so switching document types reuses the
+    buckets instead of rescanning the full list per rerun.
+
+    Returns
+    -------
+    dict
+        Mapping of lower-cased layer name to preview-row dicts.
+    """
+    by_layer = defaultdict(list)
+    for req in requirements:
+        by_layer[(req.get("layer") or "").lower()].append({
+            "id": req.get("display_id", ""),
+            "title": req.get("title") or "",
+            "description": req.get("description", "")
+        })
+    return dict(by_layer)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def render_doc_bytes(doc_type, ctx):
+    """
+    Render a document and UTF-8 encode it, memoized on its inputs.
+
+    Reruns with an unchanged document type and context skip both the Jinja
+    render and the encode.
+    """
+    return render_doc(doc_type, ctx).encode("utf-8")
+
+
 # ---------------- Preview & Export Doc ----------------
 def preview_and_export():
     """
@@ -131,19 +257,13 @@ def preview_and_export():
         help="Select which template to render."
     )
 
-    # Fetch all requirements
-    all_requirements = fetch_requirements()
-    
-    # Filter requirements based on the selected document type
-    filtered_requirements = [
-        {
-            "id": req.get("display_id", ""),
-            "title": req.get("title", ""),
-            "description": req.get("description", "")
-        }
-        for req in all_requirements 
-        if req.get("layer", "").lower() == doc_layer_map[doc_type].lower()
-    ]
+    # Fetch all requirements (shares the aggregated bootstrap response)
+    all_requirements = fetch_bootstrap().get("requirements", [])
+
+    # Select the bucket for the chosen document type (buckets are cached)
+    filtered_requirements = group_preview_rows_by_layer(all_requirements).get(
+        doc_layer_map[doc_type].lower(), []
+    )
 
     ctx = {
         "project_name": "Demo Project",
@@ -153,17 +273,17 @@ def preview_and_export():
     }
 
     try:
-        md_output = render_doc(doc_type, ctx)
+        md_bytes = render_doc_bytes(doc_type, ctx)
     except Exception as exc:
         st.error(f"Render error: {exc}")
         return
 
     st.subheader("Preview")
-    st.markdown(md_output)
+    st.markdown(md_bytes.decode("utf-8"))
 
     st.download_button(
         "Download Markdown",
-        data=md_output.encode("utf-8"),
+        data=md_bytes,
         file_name=f"{doc_type}.md",
         mime="text/markdown"
     )
@@ -200,7 +320,7 @@ def load_demo_data_ui(): # Renamed function
 def view_edit_requirements():
     st.title("📜 View/Edit Requirements")
 
-    all_reqs = fetch_requirements()
+    all_reqs = fetch_bootstrap().get("requirements", [])
     if not all_reqs:
         st.info("No requirements found.")
         return
@@ -225,19 +345,55 @@ def view_edit_requirements():
     # show quick count badge
     st.caption(f"{len(requirements)} requirement(s) shown")
 
-    for req in requirements:
-        disp_id = req.get("display_id", "UNKNOWN")
-        layer_lbl = req.get("layer", "Unspecified")
-        with st.expander(f"[{layer_lbl}] {disp_id}: {req['description']}"):
-            if st.session_state['deleting'].get(disp_id, False):
-                confirm_delete_ui(req)
-            elif not st.session_state['editing'].get(disp_id, False):
-                view_requirement_ui(req)
-            else:
-                edit_requirement_ui(req)
+    # One selectable table instead of N expanders: only the selected row's
+    # detail/edit UI is built per rerun, so widget construction cost stays
+    # constant as the list grows.
+    df = pd.DataFrame(
+        [
+            {
+                "display_id": r.get("display_id", "UNKNOWN"),
+                "layer": r.get("layer") or "Unspecified",
+                "type": r.get("type", ""),
+                "priority": r.get("priority", ""),
+                "status": r.get("status", ""),
+                "description": r.get("description", ""),
+            }
+            for r in requirements
+        ]
+    )
+    selection = st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+    )
+
+    selected_rows = selection.selection.rows
+    if not selected_rows:
+        st.info("Select a row to view or edit its details.")
+        return
+
+    req = requirements[selected_rows[0]]
+    disp_id = req.get("display_id", "UNKNOWN")
+    if st.session_state['deleting'].get(disp_id, False):
+        confirm_delete_ui(req)
+    elif not st.session_state['editing'].get(disp_id, False):
+        view_requirement_ui(req)
+    else:
+        # Reuse the list fetched above instead of refetching inside the
+        # edit form, and hand over the id list built once for all rows.
+        all_ids = [r["display_id"] for r in all_reqs]
+        edit_requirement_ui(req, all_reqs, all_ids)
 
+@st.fragment
 def confirm_delete_ui(req):
-    """Show delete confirmation UI."""
+    """Show delete confirmation UI.
+
+    Runs as a fragment so interactions inside it rerun only this block;
+    the confirm/cancel handlers still trigger a full rerun because they
+    change what the surrounding page shows.
+    """
     st.warning(f"Are you sure you want to delete {req['display_id']}?")
     col1, col2 = st.columns(2)
     with col1:
@@ -254,6 +410,13 @@ def confirm_delete_ui(req):
             st.session_state['deleting'][req['display_id']] = False
             st.rerun()
 
+def _version_timestamp(version):
+    """Format a version's timestamp (ns since epoch from the API) for display."""
+    ts = version["timestamp"]
+    if isinstance(ts, (int, float)):
+        ts = datetime.fromtimestamp(ts / 1e9, tz=timezone.utc).isoformat()
+    return ts
+
 def view_requirement_ui(req):
     """Display requirement details in read-only mode."""
     st.markdown(f"**Layer:** {req.get('layer', 'Unspecified')}")
@@ -270,12 +433,22 @@ def view_requirement_ui(req):
         for link in links:
             st.markdown(f"- {link['type']} ➞ `{link['target_id']}`")
 
-    if req.get("versions"):
+    versions = req.get("versions") or []
+    if versions:
         st.markdown("---")
         st.subheader("📜 Version History")
-        for v in reversed(req["versions"]):
-            st.markdown(f"- **{v['timestamp']}**")
+        # Newest first, capped at the latest 20 inline: every st.json is a
+        # widget, so unbounded histories would add linear render cost per
+        # rerun. Older entries stay available behind an expander.
+        for v in versions[-20:][::-1]:
+            st.markdown(f"- **{_version_timestamp(v)}**")
             st.json(v["data"])
+        older = versions[:-20]
+        if older:
+            with st.expander(f"Show {len(older)} older version(s)"):
+                for v in older[::-1]:
+                    st.markdown(f"- **{_version_timestamp(v)}**")
+                    st.json(v["data"])
 
     col1, col2 = st.columns(2)
     with col1:
@@ -287,14 +460,43 @@ def view_requirement_ui(req):
             st.session_state['deleting'][req['display_id']] = True
             st.rerun()
 
-def edit_requirement_ui(req):
-    """Provide a form to edit a requirement."""
-    type_options = fetch_metadata("types")
-    priority_options = fetch_metadata("priority")
-    source_options = fetch_metadata("source")
-    status_options = fetch_metadata("status")
-    all_requirements = fetch_requirements()
-    available_target_ids = [r["display_id"] for r in all_requirements if r["display_id"] != req["display_id"]]
+def _add_link_row(session_key):
+    """Callback: append an empty link row to the session-state list."""
+    st.session_state[session_key].append({"target_id": "", "type": "DependsOn"})
+
+def _remove_link_row(session_key, index):
+    """Callback: drop the link row at *index* from the session-state list."""
+    st.session_state[session_key].pop(index)
+
+@st.fragment
+def edit_requirement_ui(req, all_requirements=None, all_ids=None):
+    """Provide a form to edit a requirement.
+
+    Runs as a fragment: link-row callbacks and widget interactions rerun
+    only this form instead of the whole script. Save/cancel keep their
+    full st.rerun() because they change the surrounding list view.
+
+    Parameters
+    ----------
+    req : dict
+        The requirement being edited.
+    all_requirements : list, optional
+        Pre-fetched requirements list; fetched on demand when the caller
+        doesn't already have one.
+    all_ids : list, optional
+        Pre-built display-id list for *all_requirements*, so per-row
+        exclusion doesn't rescan the full requirement dicts.
+    """
+    boot = fetch_bootstrap()
+    type_options = boot.get("types", [])
+    priority_options = boot.get("priority", [])
+    source_options = boot.get("source", [])
+    status_options = boot.get("status", [])
+    if all_requirements is None:
+        all_requirements = boot.get("requirements", [])
+    if all_ids is None:
+        all_ids = [r["display_id"] for r in all_requirements]
+    available_target_ids = [i for i in all_ids if i != req["display_id"]]
     link_types = ["DependsOn", "Satisfies", "Refines"]
 
     session_key = f"link_rows_{req['display_id']}"
@@ -303,6 +505,32 @@ def edit_requirement_ui(req):
 
     link_rows = st.session_state[session_key]
 
+    # Link rows live outside the form: add/remove mutate session state via
+    # on_click callbacks, so Streamlit re-renders without st.rerun() (and
+    # without repeating the fetches a full-script rerun would trigger).
+    st.markdown("**Edit Links**")
+    updated_links = []
+    for i, link in enumerate(link_rows):
+        col1, col2, col3 = st.columns([2, 1, 0.5])
+        with col1:
+            target = st.selectbox(f"Target {i+1}", ["None"] + available_target_ids,
+                                  index=(available_target_ids.index(link["target_id"]) + 1)
+                                  if link["target_id"] in available_target_ids else 0,
+                                  key=f"edit_target_{req['display_id']}_{i}")
+        with col2:
+            type_val = st.selectbox(f"Type {i+1}", link_types,
+                                    index=link_types.index(link["type"]),
+                                    key=f"edit_type_{req['display_id']}_{i}")
+        with col3:
+            st.button(f"Remove Link {i+1}",
+                      key=f"remove_link_{req['display_id']}_{i}",
+                      on_click=_remove_link_row, args=(session_key, i))
+        if target != "None":
+            updated_links.append({"target_id": target, "type": type_val})
+
+    st.button("➕ Add Link", key=f"add_link_{req['display_id']}",
+              on_click=_add_link_row, args=(session_key,))
+
     with st.form(f"edit_form_{req['display_id']}"):
         st.text_input("Display ID", value=req["display_id"], disabled=True)
         type_ = st.selectbox("Type", type_options, index=type_options.index(req["type"]))
@@ -313,30 +541,6 @@ def edit_requirement_ui(req):
         status = st.selectbox("Status", status_options, index=status_options.index(req["status"]))
         verification = st.text_area("Verification", value=req.get("verification", ""))
 
-        st.markdown("**Edit Links**")
-        updated_links = []
-        for i, link in enumerate(link_rows):
-            col1, col2, col3 = st.columns([2, 1, 0.5])
-            with col1:
-                target = st.selectbox(f"Target {i+1}", ["None"] + available_target_ids,
-                                      index=(available_target_ids.index(link["target_id"]) + 1)
-                                      if link["target_id"] in available_target_ids else 0,
-                                      key=f"edit_target_{req['display_id']}_{i}")
-            with col2:
-                type_val = st.selectbox(f"Type {i+1}", link_types,
-                                        index=link_types.index(link["type"]),
-                                        key=f"edit_type_{req['display_id']}_{i}")
-            with col3:
-                if st.form_submit_button(f"Remove Link {i+1}"):
-                    st.session_state[session_key].pop(i)
-                    st.rerun()
-            if target != "None":
-                updated_links.append({"target_id": target, "type": type_val})
-
-        if st.form_submit_button("➕ Add Link"):
-            st.session_state[session_key].append({"target_id": "", "type": "DependsOn"})
-            st.rerun()
-
         col1, col2 = st.columns(2)
         with col1:
             save = st.form_submit_button("Save Changes")
@@ -379,10 +583,11 @@ def add_new_requirement():
     """UI to add a new requirement."""
     st.title("➕ Add New Requirement")
 
-    type_options = fetch_metadata("types")
-    priority_options = fetch_metadata("priority")
-    source_options = fetch_metadata("source")
-    status_options = fetch_metadata("status")
+    boot = fetch_bootstrap()
+    type_options = boot.get("types", [])
+    priority_options = boot.get("priority", [])
+    source_options = boot.get("source", [])
+    status_options = boot.get("status", [])
 
     with st.form(key="requirement_form"):
         type_ = st.selectbox("Type", type_options)
@@ -418,7 +623,7 @@ def add_new_requirement():
 def validate_and_approve():
     """UI to validate and approve/reject draft requirements."""
     st.title("✅ Validate & Approve Requirements")
-    requirements = fetch_requirements()
+    requirements = fetch_requirements_cached()
     draft_reqs = [r for r in requirements if r["status"] == "Draft"]
     if not draft_reqs:
         st.info("No draft requirements.")
@@ -455,14 +660,22 @@ def export_requirements():
     """
     st.title("📤 Export Requirements")
 
-    # Requirements Export
-    requirements = fetch_requirements()
+    # Requirements Export: write the dict list straight to CSV — no
+    # intermediate DataFrame allocation just to call to_csv.
+    requirements = fetch_requirements_cached()
     if requirements:
-        df = pd.DataFrame(requirements)
-        csv = df.to_csv(index=False)
+        buf = io.StringIO()
+        fields = sorted({key for req in requirements for key in req})
+        writer = csv.DictWriter(buf, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(
+            {k: json.dumps(v) if isinstance(v, (list, dict)) else v
+             for k, v in req.items()}
+            for req in requirements
+        )
         st.download_button(
             label="⬇️ Download Requirements as CSV",
-            data=csv,
+            data=buf.getvalue(),
             file_name="requirements_export.csv",
             mime="text/csv"
         )
@@ -474,20 +687,20 @@ def export_requirements():
 
     # Traceability Matrix Export
     try:
-        with httpx.Client() as client:
-            response = client.get(f"{BACKEND_URL}/export/traceability")
-            if response.status_code == 200:
-                matrix_text = response.text
-                df_matrix = pd.read_csv(io.StringIO(matrix_text))
-                st.dataframe(df_matrix, use_container_width=True)
-                st.download_button(
-                    label="⬇️ Download Traceability Matrix",
-                    data=matrix_text,
-                    file_name="traceability_matrix.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.error("Failed to fetch traceability matrix.")
+        response = CLIENT.get("/export/traceability")
+        if response.status_code == 200:
+            # Parse straight from the response bytes and hand the same
+            # bytes to the download button — no intermediate str copy.
+            df_matrix = pd.read_csv(io.BytesIO(response.content), dtype=str, engine="c")
+            st.dataframe(df_matrix, use_container_width=True, hide_index=True)
+            st.download_button(
+                label="⬇️ Download Traceability Matrix",
+                data=response.content,
+                file_name="traceability_matrix.csv",
+                mime="text/csv"
+            )
+        else:
+            st.error("Failed to fetch traceability matrix.")
     except Exception as e:
         st.error(f"Error loading matrix: {e}")
 
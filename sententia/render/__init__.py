@@ -6,24 +6,54 @@ Usage:
     markdown = render_doc("srd", context_dict_or_dataclass)
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 _TEMPLATE_BASE = Path(__file__).parent / "templates"
 
+# Templates only change with releases: persist compiled bytecode across
+# processes and skip the per-lookup mtime stat that auto-reload costs.
+# FileSystemBytecodeCache's default directory is per-uid, so one user can't
+# pre-create or seed another user's cache on a shared host.
+# Output is Markdown, not HTML, so autoescape would only add a markupsafe
+# escape call per variable; templates that need escaping can use `| e`.
 env = Environment(
     loader=FileSystemLoader(_TEMPLATE_BASE),
-    autoescape=select_autoescape(["md", "html"])
+    autoescape=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
 )
 
+
+@lru_cache(maxsize=32)
+def _get_template(template_path: str):
+    """Memoized template lookup: repeated renders of a *kind* skip the loader."""
+    return env.get_template(template_path)
+
+
+# Precompile the known document kinds at import. Module state survives
+# Streamlit reruns (modules are only imported once per process), so even the
+# first render_doc call in a session skips the loader lookup.
+for _kind in ("srd", "sss", "srs", "std"):
+    _get_template(f"{_kind}/body.md.j2")
+del _kind
+
 def _to_mapping(ctx: Any) -> Mapping[str, Any]:
     """Convert Pydantic/dataclass/object or dict to a plain mapping."""
+    if type(ctx) is dict:
+        # Fast path: plain dicts are by far the most common context.
+        return ctx
     if isinstance(ctx, Mapping):
         return ctx
-    if hasattr(ctx, "dict"):
-        return ctx.dict()  # Pydantic
+    model_dump = getattr(ctx, "model_dump", None)
+    if model_dump is not None:
+        return model_dump()  # Pydantic v2 (.dict() is a deprecated wrapper)
+    as_dict = getattr(ctx, "dict", None)
+    if as_dict is not None:
+        return as_dict()  # Pydantic v1
     return ctx.__dict__
 
 def render_doc(kind: str, ctx: Any) -> str:
@@ -32,6 +62,5 @@ def render_doc(kind: str, ctx: Any) -> str:
     *kind*: subfolder name inside templates/
     *ctx*:  dict, pydantic model, or plain object with attributes.
     """
-    template_path = f"{kind}/body.md.j2"
-    template = env.get_template(template_path)
+    template = _get_template(f"{kind}/body.md.j2")
     return template.render(**_to_mapping(ctx))